@@ -0,0 +1 @@
+from .core import check, check_batch, check_stream, ensure_wordnet, iter_search
@@ -0,0 +1,672 @@
+from array import array
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+from nltk.corpus import wordnet as wn
+import importlib.util
+import nltk
+
+# Word search and validation for the Quartiles solver, shared by every entry point
+# so WordNet and the spell-checkers are set up once per process, on first use
+
+# Trie of every surface form WordNet recognizes, built once by ensure_wordnet()
+# Nodes are nested dicts {char: node}; a '$' key marks the end of a form.
+_TRIE: Optional[dict] = None
+# Lowercase WordNet lemma names, for O(1) membership checks in check()
+_WN_LEMMAS: FrozenSet[str] = frozenset()
+# Every pair of adjacent characters that occurs in some WordNet form
+_WN_BIGRAMS: FrozenSet[str] = frozenset()
+
+def _wordnet_forms() -> Iterator[Tuple[str, bool]]:
+    """
+    Yields (form, is_lemma) for every lemma name and every inflection one rule away from one.
+    Inflections are produced by running morphy's suffix substitutions in reverse once, plus its exception lists.
+    wn.morphy keeps re-applying its rules until something matches ('catss' -> 'cats' -> 'cat'); those
+    stacked-suffix strings are deliberately left out, so unlike wn.synsets they are not treated as words.
+    
+    :return: Lowercase WordNet forms paired with whether they are lemma names
+    :rtype: Iterator[Tuple[str, bool]]
+    """
+    substitutions = wn.MORPHOLOGICAL_SUBSTITUTIONS
+    for pos in (wn.NOUN, wn.VERB, wn.ADJ, wn.ADV):
+        rules = substitutions.get(pos, [])
+        for lemma in wn.all_lemma_names(pos):
+            lemma = lemma.lower()
+            yield lemma, True
+            for suffix, ending in rules:
+                if lemma.endswith(ending):
+                    yield lemma[:len(lemma) - len(ending)] + suffix, False
+        # Irregular forms ('geese', 'went') only exist here; fail loudly if NLTK ever renames it
+        for form in wn._exception_map[pos]:
+            yield form.lower(), False
+
+def ensure_wordnet() -> dict:
+    """
+    Downloads WordNet if needed and returns the trie of its word forms, building it on first call.
+    Also populates _WN_LEMMAS and _WN_BIGRAMS from the same data.
+    
+    :return: Root node of the WordNet trie
+    :rtype: dict
+    """
+    global _TRIE, _WN_LEMMAS, _WN_BIGRAMS
+    if _TRIE is not None:
+        return _TRIE
+    try:
+        wn.synsets("test")
+    except LookupError:
+        nltk.download("wordnet", quiet=True)
+    
+    root: dict = {}
+    lemmas = set()
+    for form, is_lemma in _wordnet_forms():
+        node = root
+        for ch in form:
+            node = node.setdefault(ch, {})
+        node['$'] = True
+        if is_lemma:
+            lemmas.add(form)
+    _WN_LEMMAS = frozenset(lemmas)
+    
+    # Each parent -> child edge in the trie is a bigram of some form
+    bigrams = set()
+    stack = [(ch, child) for ch, child in root.items() if ch != '$']
+    while stack:
+        ch, node = stack.pop()
+        for nxt, child in node.items():
+            if nxt != '$':
+                bigrams.add(ch + nxt)
+                stack.append((nxt, child))
+    _WN_BIGRAMS = frozenset(bigrams)
+    _TRIE = root
+    return _TRIE
+
+def _trie_walk(node: dict, s: str) -> Optional[dict]:
+    """
+    Follows s down the trie from node.
+    
+    :param node: Trie node to start from
+    :type node: dict
+    :param s: Characters to follow
+    :type s: str
+    :return: The node reached, or None if s leaves the trie
+    :rtype: Optional[dict]
+    """
+    for ch in s:
+        node = node.get(ch)
+        if node is None:
+            return None
+    return node
+
+def _trie_contains(wl: str) -> bool:
+    """
+    Returns True if wl is a WordNet form, checked in O(len(wl)) without touching the corpus.
+    
+    :param wl: Lowercase word to look up
+    :type wl: str
+    :rtype: bool
+    """
+    node = _trie_walk(ensure_wordnet(), wl)
+    return node is not None and '$' in node
+
+# Secondary spell-checker (pyspellchecker) for cross-validation, loaded by _spell() on first use
+_SPELL = None
+_SPELL_LOADED = False
+# Its known words as one frozen set, so a lookup is a single hash probe
+_SPELL_SET: Optional[FrozenSet[str]] = None
+
+# Tertiary spell-checker (pyenchant) for triple cross-validation, loaded by _enchant() on first use
+_ENCHANT = None
+_ENCHANT_LOADED = False
+# Memoized _ENCHANT.check results (bounded by the candidate space)
+_ENCHANT_CACHE: Dict[str, bool] = {}
+
+def _spell():
+    """
+    Returns the pyspellchecker instance, loading its frequency dictionary on first call.
+    
+    :return: SpellChecker, or None if pyspellchecker isn't installed
+    :rtype: Optional[SpellChecker]
+    """
+    global _SPELL, _SPELL_LOADED
+    if not _SPELL_LOADED:
+        try:
+            from spellchecker import SpellChecker
+            _SPELL = SpellChecker(language='en')
+        except ImportError:
+            _SPELL = None
+        _SPELL_LOADED = True
+    return _SPELL
+
+def _spell_set() -> FrozenSet[str]:
+    """
+    Returns the words pyspellchecker knows, building the set on first call.
+    
+    :return: Known words (empty if pyspellchecker isn't installed)
+    :rtype: FrozenSet[str]
+    """
+    global _SPELL_SET
+    if _SPELL_SET is None:
+        sp = _spell()
+        _SPELL_SET = frozenset(sp.word_frequency.dictionary) if sp else frozenset()
+    return _SPELL_SET
+
+def _enchant():
+    """
+    Returns the pyenchant en_US dictionary, opening it on first call.
+    
+    :return: enchant.Dict, or None if pyenchant or its en_US dictionary is unavailable
+    :rtype: Optional[enchant.Dict]
+    """
+    global _ENCHANT, _ENCHANT_LOADED
+    if not _ENCHANT_LOADED:
+        try:
+            import enchant
+            _ENCHANT = enchant.Dict("en_US")
+        except (ImportError, Exception):
+            _ENCHANT = None
+        _ENCHANT_LOADED = True
+    return _ENCHANT
+
+# Load numpy (optional) for batch WordNet lookups
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# numba (optional) JIT-compiles the fragment search; it is only imported by _jit_kernel(),
+# the first time a search is big enough to use it
+_NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+# Candidates are validated in batches of this size, bounding memory while streaming
+_BATCH_SIZE = 1024
+
+def _has_wordnet_bigrams(wl: str) -> bool:
+    """
+    Returns False if wl contains a pair of adjacent characters that no WordNet form has.
+    
+    :param wl: Lowercase word to screen.
+    :type wl: str
+    :rtype: bool
+    """
+    ensure_wordnet()
+    for i in range(len(wl) - 1):
+        if wl[i:i + 2] not in _WN_BIGRAMS:
+            return False
+    return True
+
+@lru_cache(maxsize=65536)
+def _morphy(form: str) -> Optional[str]:
+    """
+    Memoized wn.morphy (the corpus reader's methods can't be decorated directly).
+    Without a POS, morphy finds a base form exactly when wn.synsets(form) would be non-empty,
+    but it skips building Synset objects.
+    
+    :param form: Lowercase word form.
+    :type form: str
+    :return: A WordNet base form of form, or None
+    :rtype: Optional[str]
+    """
+    return wn.morphy(form)
+
+def _is_wordnet_inflection(wl: str) -> bool:
+    """
+    Returns True if wl is an inflected form WordNet recognizes, e.g. 'cats' for 'cat'.
+    The trie rules out most strings before wn.morphy is consulted.
+    
+    :param wl: Lowercase word that is not a lemma name.
+    :type wl: str
+    :rtype: bool
+    """
+    return _trie_contains(wl) and _morphy(wl) is not None
+
+# _WN_LEMMAS as a sorted numpy bytes array, built by _lemma_array()
+_WN_LEMMA_ARRAY = None
+
+def _lemma_array():
+    """
+    Returns the WordNet lemma names UTF-8 encoded in a sorted numpy bytes array, building it on first call.
+    
+    :return: Sorted array of lemma names
+    :rtype: numpy.ndarray
+    """
+    global _WN_LEMMA_ARRAY
+    if _WN_LEMMA_ARRAY is None:
+        ensure_wordnet()
+        _WN_LEMMA_ARRAY = np.array(sorted(l.encode('utf-8') for l in _WN_LEMMAS))
+    return _WN_LEMMA_ARRAY
+
+def _wordnet_batch(words: List[str]) -> List[bool]:
+    """
+    Returns whether WordNet recognizes each lowercase word.
+    With numpy, lemma membership for the whole batch is one searchsorted pass over _lemma_array();
+    only the misses fall back to per-word inflection checks.
+    
+    :param words: Lowercase words to look up.
+    :type words: List[str]
+    :return: One flag per word, in order
+    :rtype: List[bool]
+    """
+    ensure_wordnet()
+    if np is None or not words:
+        in_lemmas = [w in _WN_LEMMAS for w in words]
+    else:
+        lemmas = _lemma_array()
+        batch = np.array([w.encode('utf-8') for w in words])
+        idx = np.minimum(np.searchsorted(lemmas, batch), len(lemmas) - 1)
+        in_lemmas = (lemmas[idx] == batch).tolist()
+    return [hit or _is_wordnet_inflection(w) for w, hit in zip(words, in_lemmas)]
+
+def _secondary_validators(wl: str) -> Tuple[bool, bool]:
+    """
+    Runs the spell-checkers on a lowercase word.
+    
+    :param wl: Lowercase word to check.
+    :type wl: str
+    :return: Whether pyspellchecker and pyenchant accept the word
+    :rtype: Tuple[bool, bool]
+    """
+    spell_valid = False
+    enchant_valid = False
+    
+    # Check pyspellchecker if available
+    spell_set = _spell_set()
+    if spell_set and wl in spell_set:
+        spell_valid = True
+    
+    # Check pyenchant if available
+    en = _enchant()
+    if en:
+        enchant_valid = _ENCHANT_CACHE.get(wl)
+        if enchant_valid is None:
+            enchant_valid = _ENCHANT_CACHE[wl] = bool(en.check(wl))
+    
+    return spell_valid, enchant_valid
+
+def _in_wordnet(wl: str) -> bool:
+    """
+    Returns True if WordNet recognizes a lowercase word.
+    Lemma names are a hash probe, and only inflected forms the trie knows about fall back to wn.morphy.
+    
+    :param wl: Lowercase word to check.
+    :type wl: str
+    :rtype: bool
+    """
+    ensure_wordnet()
+    return wl in _WN_LEMMAS or _is_wordnet_inflection(wl)
+
+def _validators(wl: str) -> Tuple[bool, bool, bool]:
+    """
+    Runs each available validator on a lowercase word.
+    
+    :param wl: Lowercase word to check.
+    :type wl: str
+    :return: Whether WordNet, pyspellchecker and pyenchant accept the word
+    :rtype: Tuple[bool, bool, bool]
+    """
+    return (_in_wordnet(wl),) + _secondary_validators(wl)
+
+def _classify(wl: str, wordnet_valid: bool, spell_valid: bool, enchant_valid: bool) -> str:
+    """
+    Turns validator results for a lowercase word into its status.
+    
+    :param wl: Lowercase word that was checked.
+    :type wl: str
+    :param wordnet_valid: Whether WordNet accepts the word
+    :type wordnet_valid: bool
+    :param spell_valid: Whether pyspellchecker accepts the word
+    :type spell_valid: bool
+    :param enchant_valid: Whether pyenchant accepts the word
+    :type enchant_valid: bool
+    :return: 'valid', 'unsure' or 'invalid' (see check)
+    :rtype: str
+    """
+    validators_passed = wordnet_valid + spell_valid + enchant_valid
+    
+    # Stricter validation for short words (≤3 chars)
+    is_short = len(wl) <= 3
+    total_validators = 2 + (1 if _enchant() else 0)
+    
+    if is_short:
+        # Short words: require all validators + must be in WordNet
+        if validators_passed == total_validators and wordnet_valid:
+            return 'valid'
+        elif validators_passed >= 2 and wordnet_valid:
+            return 'unsure'
+        else:
+            return 'invalid'
+    else:
+        # Longer words: standard validation
+        if validators_passed == total_validators:
+            return 'valid'
+        elif validators_passed >= total_validators - 1 and wordnet_valid:
+            return 'unsure'
+        else:
+            return 'invalid'
+
+# Dictionaries don't change during a session, so results never need invalidating.
+# check() and check_batch() both end up here, so repeated rounds hit this cache either way.
+@lru_cache(maxsize=131072)
+def _check_wordnet_word(wl: str) -> str:
+    """
+    Returns validation status for a lowercase word WordNet is already known to accept.
+    
+    :param wl: Lowercase word to check.
+    :type wl: str
+    :return: 'valid', 'unsure' or 'invalid' (see check)
+    :rtype: str
+    """
+    return _classify(wl, True, *_secondary_validators(wl))
+
+@lru_cache(maxsize=131072)
+def _check_cached(wl: str) -> str:
+    """
+    Returns validation status for a lowercase word, memoized across calls and game rounds.
+    
+    :param wl: Lowercase word to check.
+    :type wl: str
+    :return: 'valid', 'unsure' or 'invalid' (see check)
+    :rtype: str
+    """
+    # Every non-invalid status needs WordNet, so a bigram no WordNet form
+    # contains rules the word out before any validator runs
+    if not _has_wordnet_bigrams(wl):
+        return 'invalid'
+    # For the same reason, a WordNet miss is 'invalid' without asking the spell-checkers
+    if not _in_wordnet(wl):
+        return 'invalid'
+    return _check_wordnet_word(wl)
+
+def check(w: str, debug: bool = False) -> str:
+    """
+    Returns validation status for a word using triple cross-validation.
+    Stricter for shorter words (≤3 chars) which rarely show as green.
+    
+    :param w: Word to check.
+    :type w: str
+    :param debug: If True, print validation details
+    :type debug: bool
+    :return: 'valid' (green - all pass), 'unsure' (yellow - 2 pass), or 'invalid' (red - 1 or fewer pass)
+    :rtype: str
+    """
+    if not w:
+        return 'invalid'
+    wl = w.lower()
+    
+    if debug:
+        # Run the validators once and classify from the same results that get printed
+        wordnet_valid, spell_valid, enchant_valid = _validators(wl)
+        validators_passed = wordnet_valid + spell_valid + enchant_valid
+        print(f"\n{wl}: WordNet={wordnet_valid}, SpellChecker={spell_valid}, Enchant={enchant_valid}, Total={validators_passed}")
+        return _classify(wl, wordnet_valid, spell_valid, enchant_valid)
+    
+    return _check_cached(wl)
+
+def check_batch(words: List[str]) -> List[str]:
+    """
+    Returns validation status for each word, as check() would.
+    WordNet is checked for the whole batch first; since every status but 'invalid' needs
+    WordNet to agree, only the words it accepts go on to the spell-checkers.
+    
+    :param words: Words to check.
+    :type words: List[str]
+    :return: 'valid', 'unsure' or 'invalid' for each word, in order
+    :rtype: List[str]
+    """
+    lowered = [w.lower() for w in words]
+    statuses = ['invalid'] * len(words)
+    survivors = [i for i, ok in enumerate(_wordnet_batch(lowered)) if ok]
+    remaining = [lowered[i] for i in survivors]
+    for i, status in zip(survivors, map(_check_wordnet_word, remaining)):
+        statuses[i] = status
+    return statuses
+
+def check_stream(words: Iterable[str]) -> Iterator[Tuple[str, str]]:
+    """
+    Yields (word, status) pairs as words arrive, validating them with check_batch in batches of _BATCH_SIZE.
+    
+    :param words: Words to check, e.g. straight from iter_search.
+    :type words: Iterable[str]
+    :return: Each word with its status ('valid', 'unsure' or 'invalid'), in order
+    :rtype: Iterator[Tuple[str, str]]
+    """
+    it = iter(words)
+    while True:
+        batch = list(islice(it, _BATCH_SIZE))
+        if not batch:
+            break
+        yield from zip(batch, check_batch(batch))
+
+def iter_search(fragments: Iterable[str], trie: dict, minParts: int = 1, maxParts: Optional[int] = None) -> Iterator[str]:
+    """
+    Yields the distinct concatenations of distinct fragments that spell a complete WordNet form.
+    Depth-first over fragment orderings, walking the trie as it goes and backtracking as soon
+    as the concatenation so far is not a prefix of any form.
+    
+    :param fragments: Word fragments to combine
+    :type fragments: Iterable[str]
+    :param trie: Root node of the WordNet trie (see ensure_wordnet)
+    :type trie: dict
+    :param minParts: minimum number of fragments in a concatenation (>=1)
+    :type minParts: int
+    :param maxParts: maximum number of fragments in a concatenation (<= len(fragments)). If none, uses len(fragments).
+    :type maxParts: Optional[int]
+    :return: Concatenations whose path through the trie ends on a word, as they are found
+    :rtype: Iterator[str]
+    """
+    frags = list(fragments)
+    n = len(frags)
+    if n == 0:
+        return
+    if maxParts is None:
+        maxParts = n
+    minParts = max(1, int(minParts))
+    maxParts = min(n, int(maxParts))
+    if minParts > maxParts:
+        return
+    
+    if (trie is _TRIE and n <= 63 and maxParts <= _JIT_MAX_PARTS
+            and _orderings(n, maxParts) >= _JIT_MIN_ORDERINGS and _NUMBA_AVAILABLE
+            and all(f.isascii() and f.isalpha() and f.islower() for f in frags)):
+        yield from _iter_search_jit(frags, _flat_trie(), minParts, maxParts)
+        return
+    
+    frag_bytes = [f.encode('utf-8') for f in frags]
+    
+    # Fragments in use are tracked as bits of one int rather than a set
+    bits = [1 << i for i in range(n)]
+    
+    # The concatenation so far, extended on the way down and truncated on the way back
+    word = bytearray()
+    # Repeated fragments, or different splits of one word, spell the same word more than once
+    seen = set()
+    
+    def dfs(node: dict, depth: int, used: int = 0) -> Iterator[str]:
+        if depth >= minParts and '$' in node:
+            key = bytes(word)
+            if key not in seen:
+                seen.add(key)
+                yield key.decode('utf-8')
+        if depth == maxParts:
+            return
+        for i in range(n):
+            if used & bits[i]:
+                continue
+            child = _trie_walk(node, frags[i])
+            if child is None:
+                continue
+            mark = len(word)
+            word.extend(frag_bytes[i])
+            yield from dfs(child, depth + 1, used | bits[i])
+            del word[mark:]
+    
+    yield from dfs(trie, 0)
+
+# WordNet trie flattened into (children, terminal) arrays for the JIT kernel, built by _flat_trie()
+_FLAT_TRIE = None
+
+# Fragment IDs are packed 6 bits apiece into an int64, so the kernel handles at most this many parts
+_JIT_MAX_PARTS = 10
+
+# Flattening WordNet and loading the kernel cost ~2 s once per process, while the pure-Python
+# DFS searches a full 20-fragment, 4-part board (~116k orderings) in about a millisecond,
+# so only searches far beyond the game's size go through the JIT
+_JIT_MIN_ORDERINGS = 10 ** 9
+
+def _orderings(n: int, k: int) -> int:
+    """
+    Returns the number of ordered selections of k out of n fragments, P(n, k).
+    
+    :param n: Number of fragments
+    :type n: int
+    :param k: Fragments per concatenation
+    :type k: int
+    :rtype: int
+    """
+    count = 1
+    for i in range(k):
+        count *= n - i
+    return count
+
+def _flatten_trie(trie: dict):
+    """
+    Flattens a nested-dict trie into numpy arrays for the JIT kernel.
+    children[node, c] is the node reached by letter c (0 = 'a'), or -1 if there is none;
+    terminal[node] is True where a form ends. Node 0 is the root. Forms containing
+    characters outside a-z are left out, since _iter_search_jit never needs them.
+    
+    :param trie: Root node of the trie
+    :type trie: dict
+    :return: (children, terminal) arrays of shape (nodes, 26) and (nodes,)
+    :rtype: Tuple[numpy.ndarray, numpy.ndarray]
+    """
+    nodes = [trie]
+    children = array('i')
+    terminal = []
+    # nodes grows while we walk it, which numbers them in breadth-first order
+    for node in nodes:
+        row = [-1] * 26
+        for ch, child in node.items():
+            if 'a' <= ch <= 'z':
+                row[ord(ch) - 97] = len(nodes)
+                nodes.append(child)
+        children.extend(row)
+        terminal.append('$' in node)
+    return np.array(children, dtype=np.int32).reshape(-1, 26), np.array(terminal, dtype=np.bool_)
+
+def _flat_trie():
+    """
+    Returns the WordNet trie flattened by _flatten_trie, building it on first call.
+    
+    :return: (children, terminal) arrays of shape (nodes, 26) and (nodes,)
+    :rtype: Tuple[numpy.ndarray, numpy.ndarray]
+    """
+    global _FLAT_TRIE
+    if _FLAT_TRIE is None:
+        _FLAT_TRIE = _flatten_trie(ensure_wordnet())
+    return _FLAT_TRIE
+
+def _search_kernel(children, terminal, chars, lengths, minParts, maxParts):
+    """
+    Trie-pruned DFS over fragment orderings, compiled with numba by _jit_kernel().
+    Iterative, with one stack slot per depth holding the trie node, used-fragment bitmask
+    and next fragment to try.
+    
+    :return: Each word as its fragment IDs (+1) packed 6 bits apiece, first fragment highest
+    :rtype: numba.typed.List[int64]
+    """
+    n = lengths.shape[0]
+    found = TypedList.empty_list(types.int64)
+    stack_node = np.zeros(maxParts + 1, np.int32)
+    stack_used = np.zeros(maxParts + 1, np.int64)
+    stack_next = np.zeros(maxParts + 1, np.int32)
+    seq = np.zeros(maxParts, np.int32)
+    depth = 0
+    while depth >= 0:
+        i = stack_next[depth]
+        if depth == maxParts or i >= n:
+            depth -= 1
+            continue
+        stack_next[depth] = i + 1
+        used = stack_used[depth]
+        if used & (1 << i):
+            continue
+        node = stack_node[depth]
+        for j in range(lengths[i]):
+            node = children[node, chars[i, j]]
+            if node < 0:
+                break
+        if node < 0:
+            continue
+        seq[depth] = i
+        depth += 1
+        if depth >= minParts and terminal[node]:
+            packed = 0
+            for k in range(depth):
+                packed = (packed << 6) | (seq[k] + 1)
+            found.append(packed)
+        stack_node[depth] = node
+        stack_used[depth] = used | (1 << i)
+        stack_next[depth] = 0
+    return found
+
+# Compiled _search_kernel, and the numba names it uses, bound by _jit_kernel()
+_JIT_KERNEL = None
+types = TypedList = None
+
+def _jit_kernel():
+    """
+    Imports numba and compiles _search_kernel on first call.
+    
+    :return: The njit-compiled kernel
+    """
+    global _JIT_KERNEL, types, TypedList
+    if _JIT_KERNEL is None:
+        from numba import njit, types
+        from numba.typed import List as TypedList
+        _JIT_KERNEL = njit(cache=True)(_search_kernel)
+    return _JIT_KERNEL
+
+def _encode_fragments(frags: List[str]):
+    """
+    Encodes lowercase a-z fragments once into one contiguous int8 matrix for the JIT kernel.
+    chars[i, j] is letter j of fragment i (0 = 'a'), padded with -1; lengths[i] is its length.
+    
+    :param frags: Fragments to encode
+    :type frags: List[str]
+    :return: (chars, lengths) arrays of shape (len(frags), longest) and (len(frags),)
+    :rtype: Tuple[numpy.ndarray, numpy.ndarray]
+    """
+    lengths = np.fromiter(map(len, frags), dtype=np.int32, count=len(frags))
+    chars = np.full((len(frags), max(1, int(lengths.max()))), -1, dtype=np.int8)
+    for i, f in enumerate(frags):
+        chars[i, :len(f)] = np.frombuffer(f.encode('ascii'), dtype=np.int8) - ord('a')
+    return chars, lengths
+
+def _iter_search_jit(frags: List[str], flat, minParts: int, maxParts: int) -> Iterator[str]:
+    """
+    Runs iter_search() for lowercase a-z fragments through the compiled kernel.
+    
+    :param frags: Fragments to combine (at most 63, since IDs are packed 6 bits apiece)
+    :type frags: List[str]
+    :param flat: (children, terminal) arrays from _flatten_trie
+    :type flat: Tuple[numpy.ndarray, numpy.ndarray]
+    :param minParts: minimum number of fragments in a concatenation (>=1)
+    :type minParts: int
+    :param maxParts: maximum number of fragments in a concatenation (<= _JIT_MAX_PARTS)
+    :type maxParts: int
+    :return: Concatenations whose path through the trie ends on a word
+    :rtype: Iterator[str]
+    """
+    children, terminal = flat
+    chars, lengths = _encode_fragments(frags)
+    
+    seen = set()
+    for packed in _jit_kernel()(children, terminal, chars, lengths, minParts, maxParts):
+        parts = []
+        while packed:
+            parts.append(frags[(packed & 63) - 1])
+            packed >>= 6
+        w = "".join(reversed(parts))
+        if w not in seen:
+            seen.add(w)
+            yield w
@@ -0,0 +1,26 @@
+import pytest
+
+pytest.importorskip("nltk")
+
+from quartiles import core
+
+# Lemma names, regular and irregular inflections, mixed case, non-words and the empty string
+WORDS = ["cat", "Cats", "dogs", "geese", "went", "HouseBoat", "xyzzy", "qx", ""]
+IN_WORDNET = {"cat": True, "cats": True, "geese": True, "went": True, "xyzzy": False}
+
+
+def test_wordnet_batch_with_numpy():
+    pytest.importorskip("numpy")
+    assert core._wordnet_batch(list(IN_WORDNET)) == list(IN_WORDNET.values())
+    assert core.check_batch(WORDS) == [core.check(w) for w in WORDS]
+
+
+def test_wordnet_batch_without_numpy(monkeypatch):
+    monkeypatch.setattr(core, "np", None)
+    assert core._wordnet_batch(list(IN_WORDNET)) == list(IN_WORDNET.values())
+    assert core.check_batch(WORDS) == [core.check(w) for w in WORDS]
+
+
+def test_check_stream_matches_check(monkeypatch):
+    monkeypatch.setattr(core, "_BATCH_SIZE", 4)
+    assert list(core.check_stream(WORDS)) == [(w, core.check(w)) for w in WORDS]
@@ -0,0 +1,50 @@
+import pytest
+
+pytest.importorskip("nltk")
+
+from quartiles import core
+
+
+def _trie(words):
+    root = {}
+    for w in words:
+        node = root
+        for ch in w:
+            node = node.setdefault(ch, {})
+        node['$'] = True
+    return root
+
+
+@pytest.mark.parametrize("minParts, maxParts, expected", [
+    (1, 3, ["at", "ca", "cat", "cats"]),
+    (2, 2, ["cat"]),
+    (3, 3, ["cats"]),
+    (3, 2, []),
+])
+def test_iter_search_bounds_and_dedup(minParts, maxParts, expected):
+    trie = _trie(["ca", "cat", "cats", "at"])
+    # The two "t" fragments both spell "cat", which must come out once
+    got = list(core.iter_search(["ca", "t", "t", "s", "at"], trie, minParts, maxParts))
+    assert sorted(got) == expected
+    assert len(got) == len(set(got))
+
+
+def test_jit_matches_python_dfs_on_small_trie():
+    pytest.importorskip("numba")
+    trie = _trie(["cat", "cats", "catsup", "house", "houseboat", "boat", "dog", "dogs", "read", "reading", "at", "ad"])
+    fragments = "ca t s up house bo at do g re ad in g".split()
+    expected = list(core.iter_search(fragments, trie, 1, 4))
+    got = list(core._iter_search_jit(fragments, core._flatten_trie(trie), 1, 4))
+    assert sorted(got) == sorted(expected)
+    assert len(got) == len(set(got))
+
+
+@pytest.mark.parametrize("minParts, maxParts", [(1, 4), (2, 3), (4, 4)])
+def test_jit_matches_python_dfs_on_wordnet(minParts, maxParts):
+    pytest.importorskip("numba")
+    fragments = "qu ar ti les so lv er pu zz le wo rd fr ag me nt ca te go ry".split()
+    # A 20-fragment board is below _JIT_MIN_ORDERINGS, so iter_search takes the Python DFS
+    expected = list(core.iter_search(fragments, core.ensure_wordnet(), minParts, maxParts))
+    got = list(core._iter_search_jit(fragments, core._flat_trie(), minParts, maxParts))
+    assert sorted(got) == sorted(expected)
+    assert len(got) == len(set(got))